@@ -14,18 +14,40 @@ Both models have various methods that perform calculations, handle redirects to
 Please note that this code is meant to be used within an Odoo environment, and it relies on the Odoo framework and its ORM (Object-Relational Mapping) system to function properly.
 
 """
-from os import urandom
 import hashlib
-import uuid
 from xmlrpc.client import boolean
 from odoo import models, fields, api, _, http
 from datetime import datetime, timedelta
 from odoo.exceptions import UserError
 from typing import Union, List, Dict, Type
+from collections import defaultdict
+from .utils import generate_guids
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
-TODAY = datetime.today()
+# static part of the window actions returned by the redirect buttons
+WINDOW_ACTION = {
+    'view_type': 'form',
+    'view_mode': 'tree,form',
+    'type': 'ir.actions.act_window',
+}
+
+MIN_TIME = datetime.min.time()
+MAX_TIME = datetime.max.time()
+
+
+def json_dumps(value) -> str:
+    """Serializes value to a JSON string, with orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+json_loads = orjson.loads if orjson else json.loads
 
 
 class Cluster(models.Model):
@@ -86,14 +108,31 @@ class Cluster(models.Model):
         copy=False
     )
 
+    partner_ids = fields.One2many(
+        "res.partner",
+        "cluster_id",
+        string="Customers",
+        copy=False
+    )
+
+    delivery_ids = fields.One2many(
+        "logistic.delivery",
+        "cluster_id",
+        string="Deliveries",
+        copy=False
+    )
+
     number_of_zones = fields.Integer(
         string="Number of zones",
         compute="_compute_number_of_zones",
+        store=True
     )
 
     total_slots = fields.Integer(
         string="Total slots",
-        compute="_compute_total_slots"
+        compute="_compute_total_slots",
+        store=True,
+        compute_sudo=True
     )
 
     total_delivered_slots = fields.Integer(
@@ -108,14 +147,17 @@ class Cluster(models.Model):
 
     total_deliveries = fields.Integer(
         string="Total deliveries",
-        compute="_compute_total_deliveries"
+        compute="_compute_total_deliveries",
+        store=True,
+        compute_sudo=True
     )
 
     total_customers = fields.Integer(
         string="Total Customers",
         compute="_compute_total_customers",
+        store=True,
+        compute_sudo=True,
         help="Total number of customers in the cluster"
-
     )
 
     reserved_volume_today = fields.Float(
@@ -140,29 +182,19 @@ class Cluster(models.Model):
         compute="_compute_color",
     )
 
-    @api.model
-    def create(self:Type['Cluster'] , values: dict) -> Union[Type['Cluster'], List[Type['Cluster']]]:
+    @api.model_create_multi
+    def create(self:Type['Cluster'], vals_list: List[Dict]) -> Type['Cluster']:
         """Overrides create to accomodate guid generation
 
         Args:
-        values (dict or list): A dictionary or a list of dictionaries containing 
-            the field values for creating the record(s).
+        vals_list (list): A list of dictionaries containing the field values for creating the records.
 
         Returns:
-            object: A newly created LogisticCluster object.
-
-        Raises:
-            ValueError: If the provided values parameter is neither a dictionary nor a list.
+            object: The newly created LogisticCluster records.
         """
-        if isinstance(values, list):
-            for val in values:
-                val['guid'] = uuid.uuid4()
-        elif isinstance(values, dict):
-            values['guid'] = uuid.uuid4()
-        else:
-            raise ValueError(
-                'Invalid values parameter. Must be a dictionary or a list of dictionaries.')
-        result = super(Cluster, self).create(values)
+        for vals, guid in zip(vals_list, generate_guids(len(vals_list))):
+            vals['guid'] = guid
+        result = super(Cluster, self).create(vals_list)
         return result
 
     @api.depends('is_active')
@@ -182,52 +214,67 @@ class Cluster(models.Model):
             else:
                 cluster.color = 1
 
+    @api.depends('partner_ids')
     def _compute_total_customers(self:Type['Cluster']) -> None:
         """
         Computes the total number of customers associated with a `LogisticCluster` record.
         Searches the `res.partner` model for all partners that have a `cluster_id` field that matches the `id` of the `LogisticCluster` record.
         Sets the `total_customers` field of the record to the count of the search result.
-        This method is automatically called whenever the `id` field of a `LogisticCluster` record changes.
+        This method is automatically called whenever a partner is added to or removed from the cluster.
         Args:
             self (RecordSet): A set of `LogisticCluster` records.
         Returns:
         None."""
+        groups = self.env["res.partner"].read_group(
+            [("cluster_id", "in", self.ids)], ["cluster_id"], ["cluster_id"])
+        counts = {group["cluster_id"][0]: group["cluster_id_count"] for group in groups}
         for cluster in self:
-            cluster.total_customers = self.env["res.partner"].search_count(
-                [("cluster_id", "=", cluster.id)])
+            cluster.total_customers = counts.get(cluster.id, 0)
 
+    @api.depends('delivery_ids')
     def _compute_total_deliveries(self:Type['Cluster']) -> None:
         """Computes the total number of deliveries associated with a `LogisticCluster` record.
             Searches the `logistic.delivery` model for all deliveries that have a `cluster_id` field that matches the `id` of the `LogisticCluster` record.
             Sets the `total_deliveries` field of the record to the count of the search result.
-            This method is automatically called whenever the `id` field of a `LogisticCluster` record changes.
+            This method is automatically called whenever a delivery is added to or removed from the cluster.
             Args:
                 self (RecordSet): A set of `LogisticCluster` records.
 
             Returns:
                 None.
             """
+        groups = self.env["logistic.delivery"].read_group(
+            [("cluster_id", "in", self.ids)], ["cluster_id"], ["cluster_id"])
+        counts = {group["cluster_id"][0]: group["cluster_id_count"] for group in groups}
         for cluster in self:
-            cluster.total_deliveries = self.env["logistic.delivery"].search_count(
-                [("cluster_id", "=", cluster.id)])
+            cluster.total_deliveries = counts.get(cluster.id, 0)
 
-    @api.onchange('zone_ids')
+    @api.depends('zone_ids', 'zone_ids.center_lon', 'zone_ids.center_lat')
     def _compute_cluster_center(self:Type['Cluster']) -> None:
         """Calculates the center longitude and latitude of a `LogisticCluster` record based on the center longitude and latitude of its associated `LogisticZone` records.
-        This method is automatically called whenever the `zone_ids` field of a `LogisticCluster` record changes.
+        The zone centers are stored, so they are aggregated in a single SQL query for the whole recordset.
         Args:
             self (RecordSet): A set of `LogisticCluster` records.
         Returns:
             None.
         """
+        centers = {}
+        cluster_ids = tuple(self.ids)
+        if cluster_ids:
+            self.env["logistic.zone"].flush(["cluster_id", "center_lon", "center_lat"])
+            self.env.cr.execute("""
+                SELECT cluster_id,
+                       COALESCE(SUM(center_lon), 0),
+                       COALESCE(SUM(center_lat), 0),
+                       COUNT(*) FILTER (WHERE center_lon != 0 OR center_lat != 0)
+                FROM logistic_zone
+                WHERE cluster_id IN %s
+                GROUP BY cluster_id
+            """, (cluster_ids,))
+            centers = {cluster_id: (lon_total, lat_total, points_count)
+                       for cluster_id, lon_total, lat_total, points_count in self.env.cr.fetchall()}
         for cluster in self:
-            center_lon_total = sum(
-                zone.center_lon for zone in cluster.zone_ids if zone.center_lon)
-            center_lat_total = sum(
-                zone.center_lat for zone in cluster.zone_ids if zone.center_lat)
-            points_count = len(
-                [zone for zone in cluster.zone_ids if zone.center_lon or zone.center_lat])
-
+            center_lon_total, center_lat_total, points_count = centers.get(cluster.id, (0.0, 0.0, 0))
             if points_count > 0:
                 cluster.center_lon = center_lon_total / points_count
                 cluster.center_lat = center_lat_total / points_count
@@ -244,9 +291,12 @@ class Cluster(models.Model):
         Returns:
             None.
         """
+        groups = self.env["logistic.slot"].read_group(
+            [("cluster_id", "in", self.ids), ("is_returned", "=", True)],
+            ["cluster_id"], ["cluster_id"])
+        counts = {group["cluster_id"][0]: group["cluster_id_count"] for group in groups}
         for cluster in self:
-            cluster.total_returned_slots = len(
-                cluster.slot_ids.filtered(lambda slot: slot.is_returned))
+            cluster.total_returned_slots = counts.get(cluster.id, 0)
 
     @api.depends('slot_ids')
     def _compute_total_delivered_slots(self:Type['Cluster']) -> None:
@@ -257,9 +307,12 @@ class Cluster(models.Model):
         Returns:
             None.
         """
+        groups = self.env["logistic.slot"].read_group(
+            [("cluster_id", "in", self.ids), ("is_delivered", "=", True)],
+            ["cluster_id"], ["cluster_id"])
+        counts = {group["cluster_id"][0]: group["cluster_id_count"] for group in groups}
         for cluster in self:
-            cluster.total_delivered_slots = len(
-                cluster.slot_ids.filtered(lambda slot: slot.is_delivered))
+            cluster.total_delivered_slots = counts.get(cluster.id, 0)
 
     @api.depends('slot_ids')
     def _compute_reserved_volume_today(self:Type['Cluster']) -> None:
@@ -270,98 +323,84 @@ class Cluster(models.Model):
         Returns:
             None.
         """
+        today = fields.Date.context_today(self)
+        groups = self.env["logistic.slot"].read_group(
+            [("cluster_id", "in", self.ids), ("date", "=", today)],
+            ["cluster_id", "total_volume:sum"], ["cluster_id"])
+        volumes = {group["cluster_id"][0]: group["total_volume"] for group in groups}
         for cluster in self:
-            slots_today = cluster.get_slots_by_date(
-                from_date=TODAY, to_date=TODAY)
-            total_reserved_volume = sum(slots_today.mapped("total_volume"))
-            cluster.reserved_volume_today = total_reserved_volume
+            cluster.reserved_volume_today = volumes.get(cluster.id, 0.0)
 
     @api.depends('slot_ids')
     def _compute_total_slots(self:Type['Cluster']) -> None:
         """
-        Compute the total number of slots for a cluster by counting the number of slots
-        returned by the get_slots_by_date method.
+        Compute the total number of slots for a cluster with a single grouped count
+        over all the clusters in the recordset.
 
         :return: None
         """
+        groups = self.env["logistic.slot"].read_group(
+            [("cluster_id", "in", self.ids)], ["cluster_id"], ["cluster_id"])
+        counts = {group["cluster_id"][0]: group["cluster_id_count"] for group in groups}
         for cluster in self:
-            # Call the get_slots_by_date method with all=True to retrieve all slots for the cluster.
-            slots = cluster.get_slots_by_date(all_slots=True)
-            # Count the number of slots.
-            total_slots = len(slots)
-            # Set the total_slots field on the cluster.
-            cluster.total_slots = total_slots
-
-    def get_slots_by_date(self, from_date: datetime = None, to_date: datetime = None, all_slots: bool = False) -> Union[Type['Cluster'], List[Type['Cluster']]]:
+            cluster.total_slots = counts.get(cluster.id, 0)
+
+    def get_slots_by_date(self, from_date: datetime, to_date: datetime) -> Union[Type['Cluster'], List[Type['Cluster']]]:
         """
-        Get slots for the cluster based on the provided date range and/or return all slots.
+        Get slots for the cluster within the provided date range.
 
         :param from_date: The start of the date range to search for slots.
         :type from_date: datetime
         :param to_date: The end of the date range to search for slots.
         :type to_date: datetime
-        :param all_slots: Whether to return all slots for the cluster.
-        :type all_slots: bool
-        :return: A recordset of slots for the cluster based on the provided parameters.
+        :return: A recordset of slots for the cluster within the date range.
         :rtype: recordset(logistic.slot)
         """
-        if all_slots:
-            # If all_slots is True, return all slots for the cluster.
-            return self.env["logistic.slot"].search([("cluster_id", "=", self.id)])
-        else:
-            # Otherwise, return slots for the cluster based on the provided date range.
-            return self.env["logistic.slot"].search([("cluster_id", "=", self.id), ("date", ">=", from_date), ("date", "<=", to_date)])
+        return self.env["logistic.slot"].search([("cluster_id", "=", self.id), ("date", ">=", from_date), ("date", "<=", to_date)])
 
     @api.depends('zone_ids')
     def _compute_number_of_zones(self:Type['Cluster']) -> None:
+        self.mapped('zone_ids')
         for record in self:
             record.number_of_zones = len(record.zone_ids)
 
     """Redirects"""
 
     def redirect_zones(self:Type['Cluster']) -> Dict:
-        return {
-            'name': 'Zones',
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.zone',
-            'type': 'ir.actions.act_window',
-            'domain': [('cluster_id', '=', self.id)],
-            'context': {'default_cluster_id': self.id}
-        }
+        return dict(
+            WINDOW_ACTION,
+            name='Zones',
+            res_model='logistic.zone',
+            domain=[('cluster_id', '=', self.id)],
+            context={'default_cluster_id': self.id}
+        )
 
     def redirect_slots(self:Type['Cluster']) -> Dict:
-        return {
-            'name': 'Slots',
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.slot',
-            'type': 'ir.actions.act_window',
-            'domain': [('cluster_id', '=', self.id)],
-            'context': {'default_cluster_id': self.id}
-        }
+        return dict(
+            WINDOW_ACTION,
+            name='Slots',
+            res_model='logistic.slot',
+            domain=[('cluster_id', '=', self.id)],
+            context={'default_cluster_id': self.id}
+        )
 
     def redirect_deliveries(self:Type['Cluster']) -> Dict:
-        return {
-            'name': 'Deliveries',
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.delivery',
-            'type': 'ir.actions.act_window',
-            'domain': [('cluster_id', '=', self.id)],
-            'context': {'default_cluster_id': self.id}
-        }
+        return dict(
+            WINDOW_ACTION,
+            name='Deliveries',
+            res_model='logistic.delivery',
+            domain=[('cluster_id', '=', self.id)],
+            context={'default_cluster_id': self.id}
+        )
 
     def redirect_customers(self:Type['Cluster']) -> Dict:
-        return {
-            'name': 'Customers',
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'res.partner',
-            'type': 'ir.actions.act_window',
-            'domain': [('cluster_id', '=', self.id)],
-            'context': {'default_cluster_id': self.id}
-        }
+        return dict(
+            WINDOW_ACTION,
+            name='Customers',
+            res_model='res.partner',
+            domain=[('cluster_id', '=', self.id)],
+            context={'default_cluster_id': self.id}
+        )
 
     """Redirects"""
 
@@ -374,6 +413,7 @@ class LogisticZoneDateStatus(models.Model):
     summary = fields.Text(
         string='Summary',
         compute="_compute_summary",
+        store=True
     )
 
     date = fields.Date(
@@ -403,11 +443,13 @@ class LogisticZoneDateStatus(models.Model):
 
     planned_date_begin = fields.Datetime(
         string="Planned date begin",
-        compute="_compute_planned_date_begin"
+        compute="_compute_planned_date_begin",
+        store=True
     )
     planned_date_end = fields.Datetime(
         string="Planned date end",
-        compute="_compute_planned_date_end"
+        compute="_compute_planned_date_end",
+        store=True
     )
 
     categories_summary = fields.Text(
@@ -417,23 +459,24 @@ class LogisticZoneDateStatus(models.Model):
 
     number_of_slots = fields.Integer(
         string="Number of slots",
-        compute="_compute_number_of_slots"
+        compute="_compute_number_of_slots",
+        store=True
     )
 
+    @api.depends('slot_ids')
     def _compute_number_of_slots(self:Type['LogisticZoneDateStatus']) -> None:
+        self.mapped('slot_ids')
         for status in self:
             status.number_of_slots = len(status.slot_ids)
 
     def redirect_slots(self):
-        return {
-            'name': 'Slots',
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.slot',
-            'type': 'ir.actions.act_window',
-            'domain': [('zone_status_id', '=', self.id), ('date', '=', self.date)],
-            'context': {'default_zone_status_id': self.id}
-        }
+        return dict(
+            WINDOW_ACTION,
+            name='Slots',
+            res_model='logistic.slot',
+            domain=[('zone_status_id', '=', self.id), ('date', '=', self.date)],
+            context={'default_zone_status_id': self.id}
+        )
 
     def _compute_categories_summary(self:Type['LogisticZoneDateStatus']) -> None:
         """Sets the categories summary, a field that is used in gantt view popup"""
@@ -442,47 +485,52 @@ class LogisticZoneDateStatus(models.Model):
 
     def get_categories_summary(self:Type['LogisticZoneDateStatus']) -> str:
         """Returns a string with the categories summary"""
-        categories_summary = {}
-        categories_summary_str = ""
-        for slot in self.slot_ids:
-            if slot.sale_order_line_id.product_id.categ_id:
-                if slot.sale_order_line_id.product_id.categ_id.name not in categories_summary.keys():
-                    categories_summary[slot.sale_order_line_id.product_id.categ_id.name] = slot.total_volume
-                else:
-                    categories_summary[slot.sale_order_line_id.product_id.categ_id.name] += slot.total_volume
-        for item in categories_summary:
-            categories_summary_str += f"{item} :  {str(categories_summary[item])} \n"
-        return categories_summary_str
-
+        # slot volumes are summed per product in SQL, then folded into their categories
+        groups = self.env["logistic.slot"].read_group(
+            [("zone_status_id", "=", self.id), ("product_id", "!=", False)],
+            ["product_id", "total_volume:sum"], ["product_id"])
+        products = self.env["product.product"].browse([group["product_id"][0] for group in groups])
+        categories = {product.id: product.categ_id for product in products}
+        categories_summary = defaultdict(float)
+        for group in groups:
+            categ = categories[group["product_id"][0]]
+            if categ:
+                categories_summary[categ.name] += group["total_volume"]
+        return "".join(f"{item} :  {volume} \n" for item, volume in categories_summary.items())
+
+    @api.depends('date')
     def _compute_planned_date_begin(self:Type['LogisticZoneDateStatus']) -> None:
         for status in self:
-            date = status.date
-            min_time = datetime.min.time()
-            status.planned_date_begin = datetime.combine(date, min_time)
+            status.planned_date_begin = datetime.combine(status.date, MIN_TIME) if status.date else False
 
+    @api.depends('date')
     def _compute_planned_date_end(self:Type['LogisticZoneDateStatus']) -> None:
         for status in self:
-            date = status.date
-            max_time = datetime.max.time()
-            status.planned_date_end = datetime.combine(date, max_time)
+            status.planned_date_end = datetime.combine(status.date, MAX_TIME) if status.date else False
 
+    @api.depends('total_volume', 'total_assembly')
     def _compute_summary(self:Type['LogisticZoneDateStatus']) -> None:
         for status in self:
-            volume_str = "{:.2f}".format(status.total_volume)
-            assembly_str = "{:.2f}".format(status.total_assembly)
-            status.summary = f"CBM : {volume_str} - Hours : {assembly_str}"
+            status.summary = "CBM : %.2f - Hours : %.2f" % (status.total_volume, status.total_assembly)
 
-    @api.depends("slot_ids")
+    def _get_pending_slots_sum(self:Type['LogisticZoneDateStatus'], field_name: str) -> Dict:
+        """Returns {zone_status_id: sum of field_name} over slots that are neither delivered nor cancelled"""
+        groups = self.env["logistic.slot"].read_group(
+            [("zone_status_id", "in", self.ids), ("is_delivered", "!=", True), ("status", "!=", "cancelled")],
+            ["zone_status_id", f"{field_name}:sum"], ["zone_status_id"])
+        return {group["zone_status_id"][0]: group[field_name] for group in groups}
+
+    @api.depends("slot_ids", "slot_ids.total_volume", "slot_ids.is_delivered", "slot_ids.status")
     def _compute_total_volume(self:Type['LogisticZoneDateStatus']) -> None:
+        volumes = self._get_pending_slots_sum("total_volume")
         for status in self:
-            status.total_volume = sum(status.slot_ids.filtered(
-                lambda x: x.is_delivered != True and x.status != 'cancelled').mapped("total_volume"))  # filter as required
+            status.total_volume = volumes.get(status.id, 0.0)
 
-    @api.depends("slot_ids")
+    @api.depends("slot_ids", "slot_ids.assembly_time", "slot_ids.is_delivered", "slot_ids.status")
     def _compute_total_assembly(self:Type['LogisticZoneDateStatus']) -> None:
+        assemblies = self._get_pending_slots_sum("assembly_time")
         for status in self:
-            status.total_assembly = sum(status.slot_ids.filtered(
-                lambda x: x.is_delivered != True and x.status != 'cancelled').mapped("assembly_time"))
+            status.total_assembly = assemblies.get(status.id, 0.0)
 
     @api.model
     def assign_order_date(self:Type['LogisticZoneDateStatus'], date: str) -> bool:
@@ -565,33 +613,39 @@ class Zone(models.Model):
 
     geo_fence = fields.Text(
         string='Geofence data',
+        prefetch=False
     )
 
     cluster_geo_fence = fields.Text(
         string='Cluster geo fence',
-        compute="_compute_cluster_geo_fence"
+        compute="_compute_cluster_geo_fence",
+        prefetch=False
     )
 
     other_cluster_geo_fence = fields.Text(
         string='Other cluster geo fence',
-        compute="_compute_cluster_geo_fence"
+        compute="_compute_cluster_geo_fence",
+        prefetch=False
     )
 
     center_lat = fields.Float(
         string="Center latitude",
         compute="_compute_center",
+        store=True,
         digits=(16, 10)
     )
 
     center_lon = fields.Float(
         string="Center longitude",
         compute="_compute_center",
+        store=True,
         digits=(16, 10)
     )
 
     number_of_districts = fields.Integer(
         string="Number of districts",
-        compute="_compute_number_of_districts"
+        compute="_compute_number_of_districts",
+        store=True
     )
 
     slot_ids = fields.One2many(
@@ -602,7 +656,8 @@ class Zone(models.Model):
 
     number_of_slots = fields.Integer(
         string="Number of slots",
-        compute="_compute_number_of_slots"
+        compute="_compute_number_of_slots",
+        store=True
     )
 
     number_of_deliveries = fields.Integer(
@@ -622,108 +677,104 @@ class Zone(models.Model):
         "res.company", string="Company", default=lambda self: self.env.company, readonly=True)
 
 
-    @api.model
-    def create(self:Type['Zone'], values:Dict) -> Union(Type['Zone'], list[type['Zone']]):
-        if isinstance(values, list):
-            for val in values:
-                val['guid'] = uuid.uuid4()
-        elif isinstance(values, dict):
-            values['guid'] = uuid.uuid4()
-        result = super(Zone, self).create(values)
+    @api.model_create_multi
+    def create(self:Type['Zone'], vals_list:List[Dict]) -> Type['Zone']:
+        for vals, guid in zip(vals_list, generate_guids(len(vals_list))):
+            vals['guid'] = guid
+        result = super(Zone, self).create(vals_list)
         return result
 
     def _compute_total_customers(self:Type['Zone']) -> None:
+        groups = self.env["res.partner"].read_group(
+            [("zone_id", "in", self.ids)], ["zone_id"], ["zone_id"])
+        counts = {group["zone_id"][0]: group["zone_id_count"] for group in groups}
         for zone in self:
-            zone.total_customers = self.env["res.partner"].search_count(
-                [("zone_id", "=", zone.id)])
+            zone.total_customers = counts.get(zone.id, 0)
 
+    @api.depends('slot_ids')
     def _compute_number_of_deliveries(self:Type['Zone']) -> None:
+        groups = self.env["logistic.slot"].read_group(
+            [("zone_id", "in", self.ids)], ["zone_id"], ["zone_id"])
+        counts = {group["zone_id"][0]: group["zone_id_count"] for group in groups}
         for zone in self:
-            zone.number_of_deliveries = len(
-                self.env["logistic.slot"].search([("zone_id", "=", zone.id)]))
+            zone.number_of_deliveries = counts.get(zone.id, 0)
 
+    @api.depends('slot_ids')
     def _compute_number_of_slots(self:Type['Zone']) -> None:
+        self.mapped('slot_ids')
         for zone in self:
             zone.number_of_slots = len(zone.slot_ids)
 
+    @api.depends('district_ids')
     def _compute_number_of_districts(self:Type['Zone']) -> None:
+        self.mapped('district_ids')
         for zone in self:
             zone.number_of_districts = len(zone.district_ids)
 
     """Redirects"""
 
     def redirect_customers(self:Type['Zone']) -> Dict:
-        return {
-            'name': _('Customers'),
-            'type': 'ir.actions.act_window',
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'res.partner',
-            'domain': [('zone_id', '=', self.id)],
-            'context': {'default_zone_id': self.id},
-            'target': 'current',
-        }
+        return dict(
+            WINDOW_ACTION,
+            name=_('Customers'),
+            res_model='res.partner',
+            domain=[('zone_id', '=', self.id)],
+            context={'default_zone_id': self.id},
+            target='current'
+        )
 
     def redirect_delivery(self:Type['Zone']) -> Dict:
-        return {
-            'name': _('Deliveries'),
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.delivery',
-            'type': 'ir.actions.act_window',
-            'domain': [('zone_id', '=', self.id)]
-        }
+        return dict(
+            WINDOW_ACTION,
+            name=_('Deliveries'),
+            res_model='logistic.delivery',
+            domain=[('zone_id', '=', self.id)]
+        )
 
     def redirect_slots(self:Type['Zone']) -> Dict:
-        return {
-            'name': _('Slots'),
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.slot',
-            'type': 'ir.actions.act_window',
-            'domain': [('zone_id', '=', self.id)],
-        }
+        return dict(
+            WINDOW_ACTION,
+            name=_('Slots'),
+            res_model='logistic.slot',
+            domain=[('zone_id', '=', self.id)]
+        )
 
     def redirect_districts(self:Type['Zone']) -> Dict:
-        return {
-            'name': _('Districts'),
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.district',
-            'type': 'ir.actions.act_window',
-            'domain': [('zone_id', '=', self.id)],
-            'context': {'default_zone_id': self.id}
-        }
+        return dict(
+            WINDOW_ACTION,
+            name=_('Districts'),
+            res_model='logistic.district',
+            domain=[('zone_id', '=', self.id)],
+            context={'default_zone_id': self.id}
+        )
 
     """Redirects"""
 
-    @api.onchange('geo_fence')
+    @api.depends('geo_fence')
     def _compute_center(self:Type['Zone']) -> None:
         for zone in self:
-            if zone.geo_fence:
-                center_lat_total = 0
-                center_lat_count = 0
-                center_lon_total = 0
-                center_lon_count = 0
-                geo_fence_json = json.loads(zone.geo_fence)
-                for coordinate_pair in geo_fence_json:
-                    center_lat_total += coordinate_pair.get("lat")
-                    center_lat_count += 1
-                    center_lon_total += coordinate_pair.get("lng")
-                    center_lon_count += 1
-                if center_lat_count and center_lon_count:
-                    zone.center_lat = center_lat_total / center_lat_count
-                    zone.center_lon = center_lon_total / center_lon_count
+            coordinate_pairs = json_loads(zone.geo_fence) if zone.geo_fence else []
+            if coordinate_pairs:
+                points_count = len(coordinate_pairs)
+                zone.center_lat = sum(pair["lat"] for pair in coordinate_pairs) / points_count
+                zone.center_lon = sum(pair["lng"] for pair in coordinate_pairs) / points_count
             else:
                 zone.center_lat = 0
                 zone.center_lon = 0
 
     def _compute_cluster_geo_fence(self:Type['Zone']) -> None:
+        # a single read of every zone, partitioned by cluster in memory
+        zones_by_cluster = defaultdict(list)
+        for row in self.search_read([], ["cluster_id", "geo_fence"]):
+            cluster_id = row["cluster_id"][0] if row["cluster_id"] else False
+            zones_by_cluster[cluster_id].append((row["id"], row["geo_fence"]))
         for rec in self:
-            rec.cluster_geo_fence = json.dumps(rec.search(
-                [("cluster_id", "=", rec.cluster_id.id), ('id', '!=', rec.id)]).mapped("geo_fence"))
-            rec.other_cluster_geo_fence = json.dumps(rec.search(
-                [("cluster_id", "!=", rec.cluster_id.id)]).mapped("geo_fence"))
+            cluster_id = rec.cluster_id.id
+            rec.cluster_geo_fence = json_dumps(
+                [geo_fence for zone_id, geo_fence in zones_by_cluster.get(cluster_id, []) if zone_id != rec.id])
+            rec.other_cluster_geo_fence = json_dumps(
+                [geo_fence for other_cluster_id, zones in zones_by_cluster.items() if other_cluster_id != cluster_id
+                 for zone_id, geo_fence in zones])
 
 
 class LogisticDistrict(models.Model):
@@ -772,7 +823,8 @@ class LogisticDistrict(models.Model):
 
     number_of_slots = fields.Integer(
         string="Number of slots",
-        compute="_compute_number_of_slots"
+        compute="_compute_number_of_slots",
+        store=True
     )
 
     number_of_deliveries = fields.Integer(
@@ -788,57 +840,59 @@ class LogisticDistrict(models.Model):
     company_id = fields.Many2one(
         "res.company", string="Company", default=lambda self: self.env.company, readonly=True)
 
-    @api.model
-    def create(self:Type['Zone'], values:Union(Dict, List[Dict])) -> Union([Type['Zone']]):
-        if isinstance(values, list):
-            for val in values:
-                val['guid'] = uuid.uuid4()
-        elif isinstance(values, dict):
-            values['guid'] = uuid.uuid4()
-        result = super(LogisticDistrict, self).create(values)
+    @api.model_create_multi
+    def create(self:Type['Zone'], vals_list:List[Dict]) -> Type['Zone']:
+        for vals, guid in zip(vals_list, generate_guids(len(vals_list))):
+            vals['guid'] = guid
+        result = super(LogisticDistrict, self).create(vals_list)
         return result
 
     def _compute_total_customers(self:Type['Zone']) -> None:
+        groups = self.env["res.partner"].read_group(
+            [("district_id", "in", self.ids)], ["district_id"], ["district_id"])
+        counts = {group["district_id"][0]: group["district_id_count"] for group in groups}
         for district in self:
-            district.total_customers = self.env["res.partner"].search_count(
-                [("district_id", "=", district.id)])
+            district.total_customers = counts.get(district.id, 0)
 
-    @api.constrains('slot_ids')
+    @api.depends('slot_ids')
     def _compute_number_of_slots(self:Type['Zone']) -> None:
+        self.mapped('slot_ids')
         for record in self:
             record.number_of_slots = len(record.slot_ids)
 
+    @api.depends('slot_ids')
     def _compute_number_of_deliveries(self:Type['Zone']) -> None:
+        # one group per (district, delivery) pair, so counting groups gives distinct deliveries
+        groups = self.env["logistic.slot"].read_group(
+            [("district_id", "in", self.ids), ("delivery_id", "!=", False)],
+            ["district_id", "delivery_id"], ["district_id", "delivery_id"], lazy=False)
+        counts = {}
+        for group in groups:
+            district_id = group["district_id"][0]
+            counts[district_id] = counts.get(district_id, 0) + 1
         for record in self:
-            record.number_of_deliveries = len(self.env["logistic.delivery"].search([
-                                              ("district_ids", "in", record.id)]))
+            record.number_of_deliveries = counts.get(record.id, 0)
 
     def redirect_slots(self:Type['Zone']) -> Dict:
-        return {
-            'name': _('Slots'),
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.slot',
-            'type': 'ir.actions.act_window',
-            'domain': [('district_id', '=', self.id)],
-        }
+        return dict(
+            WINDOW_ACTION,
+            name=_('Slots'),
+            res_model='logistic.slot',
+            domain=[('district_id', '=', self.id)]
+        )
 
     def redirect_deliveries(self:Type['Zone']) -> Dict:
-        return {
-            'name': _('Deliveries'),
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'logistic.delivery',
-            'type': 'ir.actions.act_window',
-            'domain': [('district_ids', 'in', self.id)]
-        }
+        return dict(
+            WINDOW_ACTION,
+            name=_('Deliveries'),
+            res_model='logistic.delivery',
+            domain=[('district_ids', 'in', self.id)]
+        )
 
     def redirect_customers(self:Type['Zone']) -> Dict:
-        return {
-            'name': _('Customers'),
-            'view_type': 'form',
-            'view_mode': 'tree,form',
-            'res_model': 'res.partner',
-            'type': 'ir.actions.act_window',
-            'domain': [('district_ids', 'in', self.id)]
-        }
\ No newline at end of file
+        return dict(
+            WINDOW_ACTION,
+            name=_('Customers'),
+            res_model='res.partner',
+            domain=[('district_ids', 'in', self.id)]
+        )
\ No newline at end of file
@@ -14,16 +14,11 @@ Additionally, there are computed fields that generate HTML content for displayin
 Overall, this code provides a model representation of a delivery entity and defines its behavior and functionality within the Odoo framework.
 
 """
-from cmath import e
-from inspect import trace
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import UserError
 import datetime
-from os import urandom
-import hashlib
-import uuid
-from typing import Union, Optional, Dict, Type
-from odoo.addons.sale.models.sale_order import SaleOrder
+from .utils import generate_guids, next_sequence_names
+from typing import Union, Dict, Type
 
 
 
@@ -44,6 +39,44 @@ class Delivery(models.Model):
               ("fulfilled", "Fulfilled"),
               ("cancelled", "Cancelled")]
 
+    COLOR_BY_STATUS = {"cancelled": 1,
+                       "scheduled": 3,
+                       "loaded": 6,
+                       "in_transit": 8,
+                       "fulfilled": 10}
+
+    TABLE_HEAD = '''
+                <thead style='background-color:{background_color};color:{color};'>
+                    <tr>
+                        <th colspan="{colspan}" style='background-color:{background_color};color:{color};'>
+                            {name}
+                        </th>
+                    </tr>
+                    <tr>
+                        {headers}
+                    </tr>
+                </thead>'''
+
+    # markup shown in the map side panels for a delivery without slots
+    EMPTY_DELIVERY_TABLE = '''
+            <table class="table table-bordered" style='text-align:center;width:100%;margin:0;font-size:10px;'>
+                <thead style='background-color:#714B67;color:"white";'>
+                    <tr>
+                        <th style='background-color:#714B67;color:white;'>
+                            {name}
+                        </th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr style='background-color:#714B67;color:white;'>
+                        <td>
+                            <h5 style='color:white';>Empty Delivery</h5>
+                        </td>
+                    </tr>
+                </tbody>
+            </table>
+        '''
+
     guid = fields.Char(
         string="GUID",
         readonly=True,
@@ -92,17 +125,17 @@ class Delivery(models.Model):
 
     total_volume = fields.Float(
         string="Total Volume",
-        compute="_compute_total_volume"
+        compute="_compute_volumes"
     )
 
     delivered_volume = fields.Float(
         string="Delivered Volume",
-        compute="_compute_delivered_volume"
+        compute="_compute_volumes"
     )
 
     remaining_volume = fields.Float(
         string="Remaining Volume to be delivered",
-        compute="_compute_remaining_volume"
+        compute="_compute_volumes"
     )
 
     fullfilled_date = fields.Datetime(
@@ -137,9 +170,14 @@ class Delivery(models.Model):
         compute="_compute_trip_duration"
     )
 
+    current_trip_duration = fields.Float(
+        string="Current Trip Duration",
+        compute="_compute_current_trip_duration"
+    )
+
     volume_loss = fields.Float(
         string="Volume Loss",
-        compute="_compute_volume_loss"
+        compute="_compute_volumes"
     )
 
     volume_loss_percentage = fields.Float(
@@ -149,7 +187,7 @@ class Delivery(models.Model):
 
     progress = fields.Float(
         string="Progress",
-        compute="_compute_progress",
+        compute="_compute_volumes",
         digits=(16, 4)
     )
 
@@ -233,11 +271,15 @@ class Delivery(models.Model):
 
     info = fields.Html(
         string="Info",
-        compute="_compute_info"
+        compute="_compute_info",
+        store=True,
+        compute_sudo=True
     )
     side_button_info = fields.Html(
         string="Side Button Info",
-        compute="_compute_side_button_info"
+        compute="_compute_side_button_info",
+        store=True,
+        compute_sudo=True
     )
     total_assembly = fields.Float(
         string="Total Assembly",
@@ -251,7 +293,9 @@ class Delivery(models.Model):
 
     left_side_panel_assembly_info_static = fields.Html(
         string="Assemby info static",
-        compute="_compute_assembly_info_static"
+        compute="_compute_assembly_info_static",
+        store=True,
+        compute_sudo=True
     )
 
     fsm_ids = fields.Many2many(
@@ -281,11 +325,13 @@ class Delivery(models.Model):
         "res.company", string="Company", default=lambda self: self.env.company, readonly=True)
     
     def set_all_slots_delivered(self:Type['Delivery']) -> None:
+        user_name = self.env.user.name
+        now = fields.Datetime.now()
         for delivery in self:
             if delivery.status not in self.VALID_STATUSES_SLOT_STATUS_CHANGE:
                 if delivery.slot_ids.filtered(lambda slot:slot.status == 'scheduled'):
                     delivery._set_slots_delivered(delivery)
-                    body = f'All slots has been set to delivered by {self.env.user.name} on {datetime.datetime.now()}'
+                    body = f'All slots has been set to delivered by {user_name} on {now}'
                     delivery.message_post(body=body)
                 else:
                     raise UserError("No Scheduled Slots!")
@@ -293,61 +339,58 @@ class Delivery(models.Model):
                 raise UserError("A delivery must be at least in transit if you want to deliver a slot!")
 
     def _set_slots_delivered(self:Type['Delivery'], delivery:Type['Delivery']) -> None:
-        for slot in delivery.slot_ids:
-            slot.set_delivered()
+        delivery.slot_ids.set_delivered()
 
 
     def set_all_slots_cancelled(self:Type['Delivery']) -> None:
+        user_name = self.env.user.name
+        now = fields.Datetime.now()
         for delivery in self:
             if delivery.status not in self.VALID_STATUSES_SLOT_STATUS_CHANGE:
-                scheduled_slots = delivery.slot_ids.filtered(lambda slot:slot.status == 'scheduled')
-                if scheduled_slots:
-                    for slot in scheduled_slots:
-                        delivery._set_slots_cancelled(delivery)
-                        body = f'{scheduled_slots} has been set to Cancelled by {self.env.user.name} on {datetime.datetime.now()}'
-                        delivery.message_post(body=body)
+                cancelled_slots = delivery._set_slots_cancelled(delivery)
+                if cancelled_slots:
+                    body = f'{", ".join(cancelled_slots.mapped("name"))} has been set to Cancelled by {user_name} on {now}'
+                    delivery.message_post(body=body)
                 else:
                     raise UserError("No Scheduled Slots!")
             else:
                 raise UserError("A delivery must be at least in transit if you want to Cancel a slot!")
 
-    def _set_slots_cancelled(self:Type['Delivery'], delivery:Type['Delivery']) -> None:
-        for slot in delivery.slot_ids:
-            slot.cancel_action()
+    def _set_slots_cancelled(self:Type['Delivery'], delivery:Type['Delivery']) -> Type['Slot']:
+        """Cancels the scheduled slots of the delivery and returns them"""
+        scheduled_slots = delivery.slot_ids.filtered(lambda slot:slot.status == 'scheduled')
+        scheduled_slots.cancel_action()
+        return scheduled_slots
 
-    @api.constrains("sale_order_ids")
+    @api.depends("sale_order_ids.partner_id.name")
     def _compute_customers(self:Type['Delivery']) -> None:
         """Compute the list of customers for the delivery"""
+        # Load the customers of every delivery in the batch at once
+        self.mapped("sale_order_ids.partner_id.name")
         for delivery in self:
-            # Get a list of customer names from the sale orders in the delivery
-            customer_names = [sale_order.partner_id.name for sale_order in delivery.sale_order_ids]
-            # Join the customer names into a single string with separator "-"
-            customers_str = " - ".join(customer_names)
-            # Set the customers field of the delivery to the generated string
-            delivery.customers = customers_str if customer_names else ""
+            # Join the distinct customer names into a single string with separator "-"
+            delivery.customers = " - ".join(delivery.sale_order_ids.mapped("partner_id.name"))
 
 
-    @api.constrains("vehicle_id")
     def refresh_all_vehicles_assigned(self:Type['Delivery']) -> None:
         """
         Refreshes the 'all_vehicles_assigned' field on all sale orders
         associated with this delivery
         """
-        for delivery in self:
-            for order in delivery.sale_order_ids:
-                order._compute_all_vehicles_assigned()
+        orders = self.mapped("sale_order_ids")
+        if orders:
+            orders._compute_all_vehicles_assigned()
 
 
     def reallocate_to(self:Type['Delivery'], delivery_id:str) -> bool:
-        for delivery in self:
-            if delivery_id.status == "scheduled":
-                for slot in delivery.slot_ids:
-                    slot.change_delivery(
-                        delivery_id, "Assignment", datetime.datetime.now())
-
-                return True
+        if delivery_id.status == "scheduled":
+            self.mapped("slot_ids").change_delivery(
+                delivery_id, "Assignment", datetime.datetime.now())
+            return True
 
     def return_reallocate_deliveries_view(self:Type['Delivery']) -> Dict:
+        active_ids = self.env.context.get("active_ids")
+        deliveries = self.env["logistic.delivery"].browse(active_ids or [])
         return {
             'name': 'reallocate Deliveries',
             'type': 'ir.actions.act_window',
@@ -356,60 +399,62 @@ class Delivery(models.Model):
             'res_model': 'logistic.delivery.reassignment',
             'target': 'new',
             'context': {
-                "delivery_ids": self.env.context.get("active_ids"),
-                "default_reallocated_volume": sum(self.env["logistic.delivery"].browse(self.env.context.get("active_ids")).mapped("total_volume")),
-                "default_reallocated_assembly": sum(self.env["logistic.delivery"].browse(self.env.context.get("active_ids")).mapped("total_assembly")),
+                "delivery_ids": active_ids,
+                "default_reallocated_volume": sum(deliveries.mapped("total_volume")),
+                "default_reallocated_assembly": sum(deliveries.mapped("total_assembly")),
             }
         }
 
     
 
     @api.constrains('date')
-    def _update_delivery_date_and_related_objects(self:Type['Delivery']) -> None:
+    def _check_date_not_in_past(self:Type['Delivery']) -> None:
         """
-        Update the delivery date and related objects when the delivery date changes.
-
-        This method is triggered when the 'date' field is updated on the delivery record. It ensures that the new date is not in
-        the past and updates the delivery date and related objects (slots and status records) with the new date.
+        Ensures the delivery date is not in the past.
 
         Raises:
             UserError: If the new date is in the past.
-
         """
-        # Iterate over each record that triggered the constraint (in this case, there should be only one)
+        today = fields.Date.context_today(self)
         for delivery in self:
-            # Check that the new date is not in the past
-            if delivery.date_in_past():
+            if delivery.date and delivery.date < today:
                 raise UserError("Delivery date cannot be in the past.")
 
+    def _update_delivery_date_and_related_objects(self:Type['Delivery']) -> None:
+        """
+        Update the related objects when the delivery date changes.
+
+        This method is called from create and write when the 'date' field is set on the delivery record. It updates
+        the related objects (slots, sale orders and status records) with the new date.
+        """
+        # Load the slots and their sale orders for all the deliveries at once
+        self.mapped("slot_ids.sale_order_id")
+        for delivery in self:
             # Update the delivery date
             new_date = delivery.date
 
             # Update the date on all related slots and their corresponding sale orders
-            for slot in delivery.slot_ids:
-                slot.date = new_date
-                slot.sale_order_id.delivery_date = new_date
+            delivery.slot_ids.write({"date": new_date})
+            orders = delivery.slot_ids.mapped("sale_order_id")
+            orders.write({"delivery_date": new_date})
 
-                # Get or create a new status record for the slot and sale order with the updated date
-                slot.get_or_create_status_record(slot, slot.sale_order_id)
+            # Get or create a new status record for the slots of each sale order with the updated date
+            for order in orders:
+                order_slots = delivery.slot_ids.filtered(lambda slot: slot.sale_order_id == order)
+                order_slots.get_or_create_status_record(order_slots, order)
 
 
     def date_in_past(self:Type['Delivery']) -> bool:
-        for delivery in self:
-            return True if delivery.date and delivery.date < datetime.datetime.today().date() else False
-                
-          
+        self.ensure_one()
+        return bool(self.date and self.date < fields.Date.context_today(self))
 
     @api.depends("slot_ids")
     def _compute_tech_ids(self:Type['Delivery']) -> None:
+        # load the technicians of every slot in the batch at once
+        self.mapped("slot_ids.technician_ids")
         for delivery in self:
-            tech_ids = []
             if delivery.slot_ids:
-                for slot in delivery.slot_ids:
-                    for tech in slot.technician_ids:
-                        if tech.id not in tech_ids:
-                            tech_ids.append(tech.id)
-                delivery.tech_ids = [(6, 0, tech_ids)]
+                delivery.tech_ids = [(6, 0, delivery.slot_ids.mapped("technician_ids").ids)]
             else:
                 delivery.tech_ids = False
 
@@ -427,7 +472,7 @@ class Delivery(models.Model):
             }
         }
 
-    @api.depends("slot_ids")
+    @api.depends("name", "slot_ids", "slot_ids.assembly_time", "zone_id.name")
     def _compute_assembly_info_static(self:Type['Delivery']) -> None:
         for delivery in self:
             if delivery.slot_ids:
@@ -454,41 +499,26 @@ class Delivery(models.Model):
                 
                 '''
             else:
-                delivery.left_side_panel_assembly_info_static = f'''
-                <table class="table table-bordered" style='text-align:center;width:100%;margin:0;font-size:10px;'>
-                
-                <thead style='background-color:#714B67;color:"white";'>
-                    <tr>
-                        <th style='background-color:#714B67;color:white;'>
-                            {delivery.name if delivery.name else ""}
-                        </th>
-                    </tr>
-                </thead>
-                <tbody>
-                        <tr style='background-color:#714B67;color:white;'>
-                            <td>
-                                <h5 style='color:white';>Empty Delivery</h5>
-                            </td>
-                        </tr>
-
-                    </tr>
-                </tbody>
-            </table>'''
+                delivery.left_side_panel_assembly_info_static = self.EMPTY_DELIVERY_TABLE.format(
+                    name=delivery.name or "")
 
     @api.depends("slot_ids")
     def _compute_fsm_ids(self:Type['Delivery']) -> None:
+        self.mapped("slot_ids.fsm_id")
         for delivery in self:
-            fsm_ids = []
             if delivery.slot_ids:
-                for slot in delivery.slot_ids:
-                    if slot.fsm_id:
-                        fsm_ids.append(slot.fsm_id.id)
-                delivery.fsm_ids = [(6, 0, fsm_ids)]
+                delivery.fsm_ids = [(6, 0, delivery.slot_ids.mapped("fsm_id").ids)]
             else:
                 delivery.fsm_ids = False
 
     @api.depends("fsm_ids")
     def _compute_assembly_info(self:Type['Delivery']) -> None:
+        # effective hours of all the tasks of each assembly order, for the whole batch in one query
+        order_ids = self.mapped("fsm_ids.assembly_line_id.order_id").ids
+        groups = self.env["project.task"].read_group(
+            [("assembly_sale_order_id", "in", order_ids)],
+            ["assembly_sale_order_id", "effective_hours:sum"], ["assembly_sale_order_id"]) if order_ids else []
+        effective_hours_by_order = {group["assembly_sale_order_id"][0]: group["effective_hours"] for group in groups}
         for delivery in self:
             if delivery.fsm_ids:
                 for task in delivery.fsm_ids:
@@ -507,8 +537,7 @@ class Delivery(models.Model):
                             "Total",
                             sum([
                                 line.product_id.assembly_time for line in task.assembly_line_id.order_id.order_line]),
-                            sum(self.env["project.task"].search(
-                                [("assembly_sale_order_id", "=", task.assembly_line_id.order_id.id)]).mapped("effective_hours")),
+                            effective_hours_by_order.get(task.assembly_line_id.order_id.id, 0.0),
                             ' '
                         ]
 
@@ -529,27 +558,16 @@ class Delivery(models.Model):
 
     @api.depends("slot_ids")
     def _compute_total_assembly(self:Type['Delivery']) -> None:
+        self.mapped("slot_ids.assembly_time")
         for record in self:
-            total_assembly = 0
-            for slot in record.slot_ids:
-                total_assembly += slot.assembly_time
-            record.total_assembly = total_assembly
+            record.total_assembly = sum(record.slot_ids.mapped("assembly_time"))
 
     #TODO:Create a Colors model and link them to states
     @api.depends('status')
     def _compute_color(self:Type['Delivery']) -> None:
         """Computes color depending on active or not, red for inactive and green for active"""
-        for cluster in self:
-            if cluster.status == "cancelled":
-                cluster.color = 1
-            if cluster.status == "scheduled":
-                cluster.color = 3
-            if cluster.status == "loaded":
-                cluster.color = 6
-            if cluster.status == "in_transit":
-                cluster.color = 8
-            if cluster.status == "fulfilled":
-                cluster.color = 10
+        for delivery in self:
+            delivery.color = self.COLOR_BY_STATUS.get(delivery.status, 0)
 
     def form_table_fsm(self:Type['Delivery'], headers:list, rows:list, ids:list[int], name:str = None, background_color:str = "#714B67", color: str = "white", stage: str = None, bkg_colors: str =None) -> str:
         
@@ -572,48 +590,66 @@ class Delivery(models.Model):
         
         """
         
-        bkg_colors = [
-            "#ffffff" for item in rows] if not bkg_colors else bkg_colors
-        while len(bkg_colors) < len(rows):
-            bkg_colors.append("#ffffff")
+        bkg_colors = bkg_colors or []
+        bkg_colors = bkg_colors + ["#ffffff"] * max(len(rows) - len(bkg_colors), 0)
 
         return f'''
             <table class="table table-bordered" style='text-align:center;width:280px;margin:0;font-size:10px;'>
                 
-                <thead style='background-color:{background_color};color:{color};'>
-                    <tr>
-                        <th colspan="{len(headers)}" style='background-color:{background_color};color:{color};'>
-                            {name if name else ""}
-                        </th>
-                    </tr>
-                    <tr>
-                        {" ".join([f"<th>{th}</th>" for th in headers])}
-                    </tr>
-                   
-                </thead>
+                {self.form_table_head(headers, name, background_color, color)}
                 <tbody>
-                    {" ".join([self.form_row_fsm(row,bkg_colors[index], ids[index]) for index,row in enumerate(rows)])}
+                    {"".join(self.form_row_fsm(row, bkg_colors[index], ids[index]) for index, row in enumerate(rows))}
                 </tbody>
                 
             </table>
             <img src="/logistic_automation/static/src/img/{stage}.png" style='width:40px;height:40px;'>
         '''
 
+    def form_table_head(self:Type['Delivery'], headers:list, name:str = None, background_color:str = "#714B67", color:str = "white") -> str:
+        """Returns the <thead> shared by form_table and form_table_fsm: a title row spanning all columns, then the column headers"""
+        return self.TABLE_HEAD.format(
+            background_color=background_color,
+            color=color,
+            colspan=len(headers),
+            name=name or "",
+            headers="".join(f"<th>{th}</th>" for th in headers),
+        )
+
     def form_row_fsm(self:Type['Delivery'], cells:list, color:str, id:int) -> str:
         return f'''
             <tr {f"class='tr' id='{id}'"} style='background-color:{color};'>
-                {" ".join([f"<td>{cell}</td>" for cell in cells])}
+                {"".join(f"<td>{cell}</td>" for cell in cells)}
             </tr>
         '''
 
     def _compute_sale_orders_count(self:Type['Delivery']) -> None:
+        counts = {}
+        if self.ids:
+            self.flush(["sale_order_ids"])
+            self.env.cr.execute("""
+                SELECT delivery_id, COUNT(*)
+                FROM delivery_sale_order_rel
+                WHERE delivery_id IN %s
+                GROUP BY delivery_id
+            """, (tuple(self.ids),))
+            counts = dict(self.env.cr.fetchall())
         for delivery in self:
-            delivery.sale_orders_count = len(delivery.sale_order_ids)
+            delivery.sale_orders_count = counts.get(delivery.id, 0)
 
     def _compute_task_count(self:Type['Delivery']) -> None:
+        # one group per (delivery, task) pair, so counting groups gives distinct tasks
+        groups = self.env["logistic.slot"].read_group(
+            [("delivery_id", "in", self.ids), ("fsm_id", "!=", False)],
+            ["delivery_id", "fsm_id"], ["delivery_id", "fsm_id"], lazy=False)
+        counts = {}
+        for group in groups:
+            delivery_id = group["delivery_id"][0]
+            counts[delivery_id] = counts.get(delivery_id, 0) + 1
         for delivery in self:
-            delivery.task_count = len(delivery.slot_ids.mapped("fsm_id"))
+            delivery.task_count = counts.get(delivery.id, 0)
 
+    @api.depends("name", "slot_ids", "slot_ids.total_volume", "slot_ids.status", "slot_ids.is_delivered",
+                 "vehicle_id.total_capacity", "zone_id.name", "sale_order_ids")
     def _compute_side_button_info(self:Type['Delivery']) -> None:
         for delivery in self:
             if delivery.slot_ids:
@@ -626,61 +662,32 @@ class Delivery(models.Model):
                     color="white",
                     width="100%")
             else:
-                delivery.side_button_info = f'''
-            <table class="table table-bordered" style='text-align:center;width:100%;margin:0;font-size:10px;'>
-                
-                <thead style='background-color:#714B67;color:"white";'>
-                    <tr>
-                        <th style='background-color:#714B67;color:white;'>
-                            {delivery.name if delivery.name else ""}
-                        </th>
-                    </tr>
-                </thead>
-                <tbody>
-                        <tr style='background-color:#714B67;color:white;'>
-                            <td>
-                                <h5 style='color:white';>Empty Delivery</h5>
-                            </td>
-                        </tr>
-
-                    </tr>
-                </tbody>
-            </table>
-        '''
+                delivery.side_button_info = self.EMPTY_DELIVERY_TABLE.format(
+                    name=delivery.name or "")
 
     def reset_to_scheduled(self:Type['Delivery']) -> None:
-        for delivery in self:
-            slots = delivery.slot_ids.filtered(
-                lambda slot: slot.status == "delivered" or slot.status == "returned")
-            if slots:
-                raise UserError(
-                    "Cannot reset to scheduled because there are slots in that are delivered/returned status")
-            else:
-                for slot in delivery.slot_ids:
-                    slot.status = "scheduled"
-                delivery.status = "scheduled"
-                # for order in self.sale_order_ids:
-                #     order._compute_all_deliveries_fulfilled()
+        slots = self.mapped("slot_ids")
+        if slots.filtered(lambda slot: slot.status in ("delivered", "returned")):
+            raise UserError(
+                "Cannot reset to scheduled because there are slots in that are delivered/returned status")
+        slots.write({"status": "scheduled"})
+        self.write({"status": "scheduled"})
+        # for order in self.sale_order_ids:
+        #     order._compute_all_deliveries_fulfilled()
 
     def unlink(self:Type['Delivery']) -> bool:
-        for delivery in self:
-            if delivery.status != "cancelled":
-                raise UserError("You can only delete cancelled deliveries")
-        for item in delivery.slot_ids:
-            item.unlink()
+        if self.filtered(lambda delivery: delivery.status != "cancelled"):
+            raise UserError("You can only delete cancelled deliveries")
+        self.mapped("slot_ids").unlink()
         return super(Delivery, self).unlink()
 
     def _compute_district_ids(self:Type['Delivery']) -> None:
+        self.mapped("slot_ids.district_id")
         for delivery in self:
-            if delivery.slot_ids:
-                delivery.district_ids = list(
-                    set(delivery.slot_ids.mapped("district_id")))
-            else:
-                delivery.district_ids = False
+            delivery.district_ids = delivery.slot_ids.mapped("district_id") or False
 
     # populates a vehicle slot ids with a delivery slots when a vehicle is assigned to the delivery
 
-    @api.constrains("vehicle_id")
     def assign_slots_vehicle(self:Type['Delivery']) -> None:
         for delivery in self:
             if delivery.vehicle_id:
@@ -702,19 +709,9 @@ class Delivery(models.Model):
         return f'''
             <table class="table table-bordered" style='text-align:center;width:{width};margin:0;font-size:10px;'>
                 
-                <thead style='background-color:{background_color};color:{color};'>
-                    <tr>
-                        <th colspan="{len(headers)}" style='background-color:{background_color};color:{color};'>
-                            {name if name else ""}
-                        </th>
-                    </tr>
-                    <tr>
-                        {" ".join([f"<th>{th}</th>" for th in headers])}
-                    </tr>
-                   
-                </thead>
+                {self.form_table_head(headers, name, background_color, color)}
                 <tbody>
-                    {" ".join([self.form_row(row) for row in rows])}
+                    {"".join(self.form_row(row) for row in rows)}
                 </tbody>
             </table>
         '''
@@ -722,13 +719,20 @@ class Delivery(models.Model):
     def form_row(self:Type['Delivery'], cells:list) -> str:
         return f'''
             <tr>
-                {" ".join([f"<td>{round(cell,2) if type(cell) is float else cell}</td>" for cell in cells])}
+                {"".join(f"<td>{round(cell, 2) if isinstance(cell, float) else cell}</td>" for cell in cells)}
             </tr>
            
         '''
 
+    @api.depends("status", "vehicle_id.name", "vehicle_id.total_capacity", "cluster_id.name",
+                 "slot_ids", "slot_ids.zone_id.name", "slot_ids.total_volume", "slot_ids.status", "slot_ids.is_delivered",
+                 "sale_order_ids.name", "sale_order_ids.order_assembly_time", "sale_order_ids.total_order_volume",
+                 "sale_order_ids.order_line.volume", "sale_order_ids.order_line.product_id.name",
+                 "sale_order_ids.order_line.product_id.assembly_time")
     def _compute_info(self:Type['Delivery']) -> None:
         """Perpares information for the info field, those info will be displayed in the map view"""
+        # Load the order lines and their products of every delivery in the batch at once
+        self.mapped("sale_order_ids.order_line.product_id").read(["name", "assembly_time"])
         for delivery in self:
             section_1 = '''
             <b>Vehicle:</b> {}<br>
@@ -737,8 +741,8 @@ class Delivery(models.Model):
             <b>Progress:</b> {}<br>
             <b>Cluster:</b> {}<br>
             <b>Zones:</b> {}<br>
-            '''.format(delivery.vehicle_id.name if delivery.vehicle_id else "Not assigned yet!", delivery.vehicle_id.total_capacity if delivery.vehicle_id else "Not assigned yet!", delivery.status, delivery.progress, delivery.cluster_id.name, " - ".join([zone.name for zone in delivery.slot_ids.mapped("zone_id")]))
-            tables = ""
+            '''.format(delivery.vehicle_id.name if delivery.vehicle_id else "Not assigned yet!", delivery.vehicle_id.total_capacity if delivery.vehicle_id else "Not assigned yet!", delivery.status, delivery.progress, delivery.cluster_id.name, " - ".join(delivery.slot_ids.mapped("zone_id.name")))
+            tables = []
             for order in delivery.sale_order_ids:
                 line_items = []
                 for line in order.order_line:
@@ -746,25 +750,25 @@ class Delivery(models.Model):
                         [line.product_id.name, line.product_id.assembly_time, line.volume])
                 line_items.append(
                     ["Total", order.order_assembly_time, order.total_order_volume])
-                table = self.form_table(
-                    ["Product", "Time", "CBM"], line_items, line.order_id.name)
-                tables += table
-            delivery.info = section_1 + tables
+                tables.append(self.form_table(
+                    ["Product", "Time", "CBM"], line_items, order.name))
+            delivery.info = section_1 + "".join(tables)
 
     def assign_technicians(self:Type['Delivery'], values:list[int]) -> None:
+        deliveries = self.env["logistic.delivery"].browse(
+            [item.get('delivery_id') for item in values if item.get('delivery_id')]).exists()
+        deliveries.mapped("slot_ids.sale_order_id")
+        deliveries_by_id = {delivery.id: delivery for delivery in deliveries}
         for item in values:
-            delivery_id = self.env["logistic.delivery"].search(
-                [("id", "=", item.get('delivery_id'))])
+            delivery_id = deliveries_by_id.get(item.get('delivery_id'))
             if delivery_id:
                 line_ids = delivery_id.slot_ids.filtered(
                     lambda x: x.sale_order_id.id == item.get('order_id'))
                 if line_ids:
-                    for line in line_ids:
-                        try:
-                            line_ids.technician_ids = item.get(
-                                'technician_ids')
-                        except Exception as e:
-                            raise UserError(e)
+                    try:
+                        line_ids.write({'technician_ids': item.get('technician_ids')})
+                    except Exception as e:
+                        raise UserError(e)
                 else:
                     raise UserError(
                         "No slot found for order {}".format(item.get('order_id')))
@@ -774,12 +778,12 @@ class Delivery(models.Model):
 
     @api.depends('slot_ids')
     def _compute_zone_id(self:Type['Delivery']) -> None:
+        self.mapped("slot_ids.zone_id")
         for delivery in self:
-
-            zone_ids = list(delivery.slot_ids.mapped("zone_id"))
-            if zone_ids:
-                if zone_ids.count(zone_ids[0]) == len(zone_ids):
-                    delivery.zone_id = zone_ids[0]
+            zones = delivery.slot_ids.mapped("zone_id")
+            if zones:
+                if len(zones) == 1:
+                    delivery.zone_id = zones
                     delivery.mismatched_zones = False
                 else:
                     delivery.zone_id = False
@@ -791,14 +795,16 @@ class Delivery(models.Model):
     @api.depends('sale_order_ids')
     def _compute_delivery_count(self:Type['Delivery']) -> None:
         for delivery in self:
-            if delivery.sale_order_ids:
-                delivery.delivery_count = len(delivery.sale_order_ids)
-            else:
-                delivery.delivery_count = 0
+            delivery.delivery_count = len(delivery.sale_order_ids)
+
+    @api.model
+    @tools.ormcache()
+    def _get_picking_view_ids(self:Type['Delivery']) -> tuple:
+        """Returns the (tree, form) view ids of stock pickings, cached on the registry"""
+        return self.env.ref('stock.vpicktree').id, self.env.ref('stock.view_picking_form').id
 
     def action_view_delivery(self:Type['Delivery']) -> Dict:
-        form_view_id = self.env.ref('stock.view_picking_form').id
-        tree_view_id = self.env.ref('stock.vpicktree').id
+        tree_view_id, form_view_id = self._get_picking_view_ids()
 
         return {
             'name': 'Delivery',
@@ -822,7 +828,7 @@ class Delivery(models.Model):
             else:
                 delivery.sale_order_ids = False
 
-    @api.depends('slot_ids', 'vehicle_id')
+    @api.depends('volume_loss', 'total_volume', 'vehicle_id', 'vehicle_id.total_capacity')
     def _compute_volume_loss_percentage(self:Type['Delivery']) -> None:
         for delivery in self:
             if delivery.vehicle_id and delivery.vehicle_id.total_capacity > 0 and delivery.total_volume:
@@ -831,15 +837,9 @@ class Delivery(models.Model):
             else:
                 delivery.volume_loss_percentage = 0
 
-    def ensure_fits(self:Type['Delivery']) -> None:
-        for delivery in self:
-            if delivery.vehicle_id:
-                if delivery.total_volume > delivery.vehicle_id.total_capacity:
-                    return False
-                else:
-                    return True
-            else:
-                return True
+    def ensure_fits(self:Type['Delivery']) -> bool:
+        return all(not delivery.vehicle_id or delivery.total_volume <= delivery.vehicle_id.total_capacity
+                   for delivery in self)
 
     @api.onchange("vehicle_id")
     def onchange_vehicle_id(self:Type['Delivery']) -> None:
@@ -849,78 +849,100 @@ class Delivery(models.Model):
         else:
             pass
 
-    @api.depends('delivered_volume', 'total_volume')
-    def _compute_progress(self:Type['Delivery']) -> None:
-        for delivery in self:
-            if delivery.total_volume:
-                delivery.progress = delivery.delivered_volume / delivery.total_volume * 100
-            else:
-                delivery.progress = 0
-
-    @api.depends('slot_ids')
-    def _compute_volume_loss(self:Type['Delivery']) -> None:
-        for delivery in self:
-            if delivery.vehicle_id and delivery.slot_ids:
-                total_vehicle_volume = delivery.vehicle_id.total_capacity
-                total_slots_volume = sum(
-                    delivery.slot_ids.mapped('total_volume'))
-                delivery.volume_loss = total_vehicle_volume - total_slots_volume
-            else:
-                # Was = 0, caused an issue when an empty delivery has no lines, amounts to zero while it should be vehicle total.
-                delivery.volume_loss = delivery.vehicle_id.total_capacity
-
+    @api.depends('trip_start_time', 'trip_end_time')
     def _compute_trip_duration(self:Type['Delivery']) -> None:
         for delivery in self:
             if delivery.trip_start_time and delivery.trip_end_time:
                 delivery.trip_duration = (
                     delivery.trip_end_time - delivery.trip_start_time).total_seconds() / 3600
-            elif delivery.trip_start_time and not delivery.trip_end_time:
-                delivery.trip_duration = (datetime.datetime.now(
-                ) - delivery.trip_start_time).total_seconds() / 3600
             else:
                 delivery.trip_duration = 0
 
-    @api.depends('slot_ids')
-    def _compute_total_volume(self:Type['Delivery']) -> None:
-        for record in self:
-            record.total_volume = sum(
-                slot.total_volume for slot in record.slot_ids if slot.status != "cancelled")
-
-    @api.depends("slot_ids")
-    def _compute_delivered_volume(self:Type['Delivery']) -> None:
-        for record in self:
-            record.delivered_volume = sum(
-                slot.total_volume for slot in record.slot_ids if slot.is_delivered)
-
-    @api.depends("delivered_volume", "total_volume")
-    def _compute_remaining_volume(self:Type['Delivery']) -> None:
+    def _compute_current_trip_duration(self:Type['Delivery']) -> None:
+        """Duration of the trip so far for ongoing trips, the trip duration otherwise"""
+        now = datetime.datetime.now()
+        for delivery in self:
+            if delivery.trip_start_time and not delivery.trip_end_time:
+                delivery.current_trip_duration = (now - delivery.trip_start_time).total_seconds() / 3600
+            else:
+                delivery.current_trip_duration = delivery.trip_duration
+
+    def _get_slots_volumes(self:Type['Delivery']) -> Dict:
+        """Returns {delivery_id: (non cancelled volume, delivered volume)} for the active slots of the saved deliveries"""
+        if not self.ids:
+            return {}
+        self.env["logistic.slot"].flush(["delivery_id", "total_volume", "status", "is_delivered", "active"])
+        self.env.cr.execute("""
+            SELECT delivery_id,
+                   COALESCE(SUM(total_volume) FILTER (WHERE status IS DISTINCT FROM 'cancelled'), 0),
+                   COALESCE(SUM(total_volume) FILTER (WHERE is_delivered), 0)
+            FROM logistic_slot
+            WHERE delivery_id = ANY(%s) AND active
+            GROUP BY delivery_id
+        """, (self.ids,))
+        return {delivery_id: (total_volume, delivered_volume)
+                for delivery_id, total_volume, delivered_volume in self.env.cr.fetchall()}
+
+    @api.depends('slot_ids', 'slot_ids.total_volume', 'slot_ids.status', 'slot_ids.is_delivered',
+                 'vehicle_id', 'vehicle_id.total_capacity')
+    def _compute_volumes(self:Type['Delivery']) -> None:
+        """Computes the total, delivered and remaining volumes, the progress and the volume loss in one pass"""
+        volumes = self._get_slots_volumes()
         for record in self:
-            record.remaining_volume = record.total_volume - record.delivered_volume
+            if record.id:
+                total_volume, delivered_volume = volumes.get(record.id, (0.0, 0.0))
+            else:
+                # new records (onchange) only have their slots in cache
+                total_volume = sum(
+                    slot.total_volume for slot in record.slot_ids if slot.status != "cancelled")
+                delivered_volume = sum(
+                    slot.total_volume for slot in record.slot_ids if slot.is_delivered)
+            record.total_volume = total_volume
+            record.delivered_volume = delivered_volume
+            record.remaining_volume = total_volume - delivered_volume
+            record.progress = delivered_volume / total_volume * 100 if total_volume else 0
+            # an empty delivery leaves the whole vehicle free
+            record.volume_loss = record.vehicle_id.total_capacity - total_volume if record.vehicle_id else 0
 
     
 
-    @api.model
-    def create(self:Type['Delivery'], values:Union[list[Dict], Dict]) -> Union(list[Type['Delivery']],Type['Delivery']):
+    @api.model_create_multi
+    def create(self:Type['Delivery'], vals_list:list[Dict]) -> Type['Delivery']:
         """Generate a uuid on each creation, assign delivery sequence"""
-        if isinstance(values, list):
-            for val in values:
-                val['guid'] = uuid.uuid4()
-        elif isinstance(values, dict):
-            values['guid'] = uuid.uuid4()
-        values['name'] = self.env['ir.sequence'].next_by_code(
-            'logistic.delivery.code')
-        result = super(Delivery, self).create(values)
+        names = next_sequence_names(self.env, 'logistic.delivery.code', len(vals_list))
+        guids = generate_guids(len(vals_list))
+        for vals, name, guid in zip(vals_list, names, guids):
+            vals['guid'] = guid
+            vals['name'] = name
+        result = super(Delivery, self).create(vals_list)
+        result.filtered("date")._update_delivery_date_and_related_objects()
+        result.filtered("vehicle_id")._update_vehicle_related_objects()
+        return result
+
+    def write(self:Type['Delivery'], values:Dict) -> bool:
+        """Propagates date and vehicle changes to the slots and sale orders once per write"""
+        result = super(Delivery, self).write(values)
+        if "date" in values:
+            self._update_delivery_date_and_related_objects()
+        if "vehicle_id" in values:
+            self._update_vehicle_related_objects()
         return result
 
+    def _update_vehicle_related_objects(self:Type['Delivery']) -> None:
+        self.assign_slots_vehicle()
+        self.refresh_all_vehicles_assigned()
+
     def set_loaded(self:Type['Delivery']) -> None:
         for delivery in self:
             if not delivery.vehicle_id:
                 raise UserError("Please select vehicle")
-            for sale_order in delivery.sale_order_ids:
-                for picking in sale_order.picking_ids.filtered(lambda picking: picking.location_dest_id.usage == "transit"):
-                    if picking.state != "done":
-                        raise UserError(
-                            "Please validate  all the transfers with destination 'Transit' before setting the delivery as loaded")
+        orders = self.mapped("sale_order_ids")
+        if orders and self.env["stock.picking"].search_count([
+                ("sale_id", "in", orders.ids),
+                ("location_dest_id.usage", "=", "transit"),
+                ("state", "!=", "done")]):
+            raise UserError(
+                "Please validate  all the transfers with destination 'Transit' before setting the delivery as loaded")
         self.status = "loaded"
 
     
@@ -939,11 +961,9 @@ class Delivery(models.Model):
         self.vehicle_id.is_en_route = False
 
     def ensure_slot_status_update(self:Type['Delivery']) -> Union(list[str], list):
-        result = []
-        for slot in self.slot_ids:
-            if not slot.is_delivered and not slot.is_returned:
-                result.append(slot.name)
-        return result
+        slots = self.env["logistic.slot"].search_read(
+            [("delivery_id", "in", self.ids), ("is_delivered", "=", False), ("is_returned", "=", False)], ["name"])
+        return [slot["name"] for slot in slots]
 
     def set_fulfilled(self:Type['Delivery']) -> None:
         self.status = "fulfilled"
@@ -951,15 +971,32 @@ class Delivery(models.Model):
         self._check_sale_orders_fulfilled(self) 
 
     def _check_sale_orders_fulfilled(self:Type['Delivery'], obj:Type['Delivery']) -> None:
-        for order in obj.sale_order_ids:
-            if self._is_sale_order_fulfilled(order):
+        orders = obj.mapped("sale_order_ids")
+        pending_order_ids = self._get_orders_with_pending_pickings(orders)
+        for order in orders:
+            if self._is_sale_order_fulfilled(order, pending_order_ids):
                 order.check_all_deliveries_fulfilled()
 
-    def _is_sale_order_fulfilled(self:Type['Delivery'], order:Type['SaleOrder']) -> bool:
-        for picking in order.picking_ids.filtered(lambda picking: picking.location_dest_id.usage == "customer"):
-            if picking.state != "done":
-                return False
-        return len(order.logistic_delivery_ids.filtered(lambda d: not d.status == 'delivered')) == 0
+    def _get_orders_with_pending_pickings(self:Type['Delivery'], orders:Type['SaleOrder']) -> set:
+        """Returns the ids of the given sale orders having a customer picking that is not done yet"""
+        if not orders:
+            return set()
+        groups = self.env["stock.picking"].read_group(
+            [("sale_id", "in", orders.ids),
+             ("location_dest_id.usage", "=", "customer"),
+             ("state", "!=", "done")],
+            ["sale_id"], ["sale_id"])
+        return {group["sale_id"][0] for group in groups}
+
+    def _is_sale_order_fulfilled(self:Type['Delivery'], order:Type['SaleOrder'], pending_order_ids:set=None) -> bool:
+        """pending_order_ids may hold the result of _get_orders_with_pending_pickings when checking many orders"""
+        if pending_order_ids is None:
+            pending_order_ids = self._get_orders_with_pending_pickings(order)
+        if order.id in pending_order_ids:
+            return False
+        return not self.env["logistic.delivery"].search_count([
+            ("sale_order_ids", "in", order.ids),
+            ("status", "!=", "delivered")])
 
 
     def ensure_tech_assigned(self:Type['Delivery']) -> bool:
@@ -971,23 +1008,18 @@ class Delivery(models.Model):
         return False if result else True
 
     def cancel_action(self:Type['Delivery']) -> None:
-        for delivery in self:
-            if delivery.status in ["in_transit", "loaded"]:
-                for order in delivery.sale_order_ids:
-                    validated_pickings_vehicle = order.picking_ids.filtered(
-                        lambda picking: picking.state == "done" and picking.location_dest_id.usage == 'transit')
-                    validated_pickings_customer = order.picking_ids.filtered(
-                        lambda picking: picking.state == "done" and picking.location_dest_id.usage == 'customer')
-                    if validated_pickings_vehicle or validated_pickings_customer:
-                        raise UserError(
-                            "Please reverse all validated  transfers cancel this delivery")
-            if delivery.status == "fulfilled":
-                raise UserError(
-                    "You can only cancel a delivery that is not yet fulfilled")
-            for slot in delivery.slot_ids:
-                slot.cancel_action()
-            self.status = "cancelled"
-            self.cancelled_date = fields.Datetime.now()
+        orders = self.filtered(lambda delivery: delivery.status in ["in_transit", "loaded"]).mapped("sale_order_ids")
+        if orders and self.env["stock.picking"].search_count([
+                ("sale_id", "in", orders.ids),
+                ("location_dest_id.usage", "in", ["transit", "customer"]),
+                ("state", "=", "done")]):
+            raise UserError(
+                "Please reverse all validated  transfers cancel this delivery")
+        if self.filtered(lambda delivery: delivery.status == "fulfilled"):
+            raise UserError(
+                "You can only cancel a delivery that is not yet fulfilled")
+        self.mapped("slot_ids").cancel_action()
+        self.write({"status": "cancelled", "cancelled_date": fields.Datetime.now()})
 
     def action_view_tasks(self:Type['Delivery']) -> Dict:
         return {
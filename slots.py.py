@@ -2,9 +2,7 @@
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
 import datetime
-from os import urandom
-import hashlib
-import uuid
+from .utils import generate_guids, next_sequence_names
 
 
 class Slot(models.Model):
@@ -90,14 +88,10 @@ class Slot(models.Model):
         track_visibility='onchange'
     )
 
-    assembly_time = fields.Float(
-        string="Assembly Time",
-        related="sale_order_line_id.product_id.assembly_time",
-    )
-
     total_volume = fields.Float(
         string="Total Volume",
-        related="sale_order_line_id.volume"
+        related="sale_order_line_id.volume",
+        store=True
     )
     date_delivered = fields.Datetime(
         string="Date Delivered",
@@ -141,7 +135,7 @@ class Slot(models.Model):
     assembly_time = fields.Float(
         string="Total Assembly",
         compute="_compute_total_assembly_time",
-
+        store=True
     )
 
     technician_ids = fields.Many2many(
@@ -214,7 +208,7 @@ class Slot(models.Model):
     def return_create_task_view(self):
 
         fsm_project_id = self.env["project.project"].search(
-            [("is_fsm", "=", True)])[0]
+            [("is_fsm", "=", True)], limit=1).id
         if fsm_project_id:
             """ returns the view of the return wizard"""
             return {
@@ -226,7 +220,7 @@ class Slot(models.Model):
                 'target': 'new',
                 'context': {
                     'default_name': self.name,
-                    'default_project_id': fsm_project_id.id,
+                    'default_project_id': fsm_project_id,
                     'default_assembly_line_id': self.sale_order_line_id.id,
                     'default_user_ids': [(6, 0, self.technician_ids.ids)],
                     'default_planned_date_begin': self.date_delivered,
@@ -241,24 +235,25 @@ class Slot(models.Model):
         else:
             raise UserError("Please create a FSM project")
 
+    @api.depends('sale_order_line_id.product_id.assembly_time', 'sale_order_line_id.product_uom_qty')
     def _compute_total_assembly_time(self):
         for slot in self:
             slot.assembly_time = slot.sale_order_line_id.product_id.assembly_time * \
                 slot.sale_order_line_id.product_uom_qty
 
     def compute_lon(self):
+        self.mapped("sale_order_line_id.order_id.partner_id")
+        self.mapped("zone_id")
         for slot in self:
-            if slot.sale_order_line_id.order_id.partner_id.partner_longitude:
-                slot.lon = slot.sale_order_line_id.order_id.partner_id.partner_longitude
-            else:
-                slot.lon = slot.zone_id.center_lon
+            partner = slot.sale_order_line_id.order_id.partner_id
+            slot.lon = partner.partner_longitude or slot.zone_id.center_lon
 
     def compute_lat(self):
+        self.mapped("sale_order_line_id.order_id.partner_id")
+        self.mapped("zone_id")
         for slot in self:
-            if slot.sale_order_line_id.order_id.partner_id.partner_latitude:
-                slot.lat = slot.sale_order_line_id.order_id.partner_id.partner_latitude
-            else:
-                slot.lat = slot.zone_id.center_lat
+            partner = slot.sale_order_line_id.order_id.partner_id
+            slot.lat = partner.partner_latitude or slot.zone_id.center_lat
 
     def view_change_delivery_wizard(self):
         """ returns the view of the change delivery wizard"""
@@ -278,25 +273,27 @@ class Slot(models.Model):
    
 
     def change_delivery(self, delivery_id, reason, date):
-        """Changes the delivery ID if compatible with the delivery."""
+        """Moves all the slots to the delivery in a single write if they are compatible with it."""
         if not self.check_compatible(delivery_id):
             raise UserError("The target delivery is not in scheduled state or the vehicle does not have the capacity to carry the product")
 
-        old_delivery_id = self.delivery_id
-        self.delivery_id = delivery_id
-        self.sale_order_id._compute_logistic_delivery_ids()
+        old_delivery_names = {slot.id: slot.delivery_id.name for slot in self}
+        self.write({"delivery_id": delivery_id.id})
+        self.mapped("sale_order_id")._compute_logistic_delivery_ids()
 
-        body = f"Slot transferred from {old_delivery_id.name} to {delivery_id.name} at {date} by {self.env.user.name} for the reason {reason}"
-        self.message_post(body=body)
+        user_name = self.env.user.name
+        for slot in self:
+            body = f"Slot transferred from {old_delivery_names[slot.id]} to {delivery_id.name} at {date} by {user_name} for the reason {reason}"
+            slot.message_post(body=body)
 
         return True
 
 
     def check_compatible(self, delivery_id):
-        """ Check if the slot is compatible with the delivery by checking that they have same cluster and date and the target delivery is scheduled not in transit or delivered"""
+        """ Check if the slots are compatible with the delivery by checking that they have same cluster and date and the target delivery is scheduled not in transit or delivered"""
         if delivery_id.vehicle_id:
             if delivery_id.status == "scheduled":
-                if delivery_id.volume_loss > self.total_volume:
+                if delivery_id.volume_loss > sum(self.mapped("total_volume")):
                     return True
                 else:
                     return False
@@ -306,15 +303,23 @@ class Slot(models.Model):
             raise UserError("Please Assign a vehicle to target delivery!")
 
     def cancel_action(self):
-        for slot in self:
-            if slot.status in ["delivered", "returned"]:
-                raise UserError(
-                    "Cannot cancel a slot that is delivered or returned")
-            else:
-                slot.status = 'cancelled'  # sets slot as cancelled
-                if slot.fsm_id:  # cancels related fsm
-                    slot.fsm_id = self.env["project.task.type"].search(
-                        [("name", "=", "Cancelled"), ("project_ids", "in", slot.fsm_id.project_id.id)], limit=1).id
+        if self.filtered(lambda slot: slot.status in ["delivered", "returned"]):
+            raise UserError(
+                "Cannot cancel a slot that is delivered or returned")
+        self.write({"status": 'cancelled'})  # sets slots as cancelled
+        fsm_tasks = self.mapped("fsm_id")
+        if fsm_tasks:  # cancels related fsm
+            stages = self.env["project.task.type"].search_read(
+                [("name", "=", "Cancelled"), ("project_ids", "in", fsm_tasks.mapped("project_id").ids)],
+                ["project_ids"])
+            stage_by_project = {}
+            for stage in stages:
+                for project_id in stage["project_ids"]:
+                    stage_by_project.setdefault(project_id, stage["id"])
+            for task in fsm_tasks:
+                stage_id = stage_by_project.get(task.project_id.id)
+                if stage_id:
+                    task.stage_id = stage_id
 
     def schedule(self, order):
         try:
@@ -331,54 +336,52 @@ class Slot(models.Model):
         return vehicles
 
     def create_slots(self, order, date):
-        slot_ids = []
-        for line in order.order_line:
-            try:
-                slot_id = self.create({"description": line.product_id.name,
-                                       "sale_order_line_id": line.id,
-                                       "assembly_planned_date_begin": line.order_id.installation_date,
-                                       "date": date, })
-
-                self.get_or_create_status_record(slot_id, order)
-                slot_ids.append(slot_id)
-            except Exception as e:
-                return str(e)
+        try:
+            slot_ids = self.create([{"description": line.product_id.name,
+                                     "sale_order_line_id": line.id,
+                                     "assembly_planned_date_begin": order.installation_date,
+                                     "date": date, } for line in order.order_line])
+        except Exception as e:
+            return str(e)
+        self.get_or_create_status_record(slot_ids, order)
         return slot_ids
 
    
-    def get_or_create_status_record(self, slot_id, order):
+    def get_or_create_status_record(self, slot_ids, order):
         """
-        Get or create the logistic zone status record for the given slot and order's zone.
+        Get or create the logistic zone status records for the given slots and order's zone.
 
-        :param slot_id: the ID of the logistic slot to use
-        :type slot_id: int
+        :param slot_ids: the logistic slots to use
+        :type slot_ids: logistic.slot
         :param order: the order object to use to get the zone
         :type order: logistic.order
         :return: True
         """
-        # Search for an existing logistic zone status record for the given zone and slot date
-        zone_status_id = self.env["logistic.zone.status"].search(
-            [("zone_id", "=", order.zone_id.id), ("date", "=", slot_id.date)])
-
-        # If no existing record is found, create a new one
-        if not zone_status_id:
-            zone_status_id = self.env["logistic.zone.status"].create({
-                "zone_id": order.zone_id.id,
-                "date": slot_id.date,
-                "slot_ids": [(4, slot_id.id)]
-            })
-        # If an existing record is found, add the slot to its list of slots
-        else:
-            zone_status_id.slot_ids += slot_id
+        for date in set(slot_ids.mapped("date")):
+            date_slot_ids = slot_ids.filtered(lambda slot: slot.date == date)
+            slot_commands = [(4, slot_id) for slot_id in date_slot_ids.ids]
+            # Search for an existing logistic zone status record for the given zone and slot date
+            zone_status_id = self.env["logistic.zone.status"].search(
+                [("zone_id", "=", order.zone_id.id), ("date", "=", date)], limit=1)
+
+            # If no existing record is found, create a new one
+            if not zone_status_id:
+                self.env["logistic.zone.status"].create({
+                    "zone_id": order.zone_id.id,
+                    "date": date,
+                    "slot_ids": slot_commands
+                })
+            # If an existing record is found, add the slots to its list of slots
+            else:
+                zone_status_id.write({"slot_ids": slot_commands})
         # Return True to indicate that the method executed successfully
         return True
 
 
     # Assigns slots to vehicle
     def assign_slot_to_vehicle(self, vehicle_id, slot_ids):
-        for slot_id in slot_ids:
-            vehicle_id.slot_ids += slot_id
-            slot_id.write({"vehicle_id": vehicle_id.id})
+        self.browse([slot_id.id for slot_id in slot_ids]).write(
+            {"vehicle_id": vehicle_id.id})
         return True
 
     # Creates a delivery for the order
@@ -394,16 +397,15 @@ class Slot(models.Model):
 
     # Assigns the delivery to the slots
     def assign_slot_delivery(self, delivery_id, slot_ids):
-        for slot_id in slot_ids:
-            slot_id.write({"delivery_id": delivery_id.id})
-            delivery_id.slot_ids += slot_id
+        self.browse([slot_id.id for slot_id in slot_ids]).write(
+            {"delivery_id": delivery_id.id})
         return True
 
     # Update delivery record to mark as delivered and set delivered date
     def set_delivered(self):
-        self.is_delivered = True
-        self.status = 'delivered'
-        self.date_delivered = fields.Datetime.now()
+        self.write({"is_delivered": True,
+                    "status": 'delivered',
+                    "date_delivered": fields.Datetime.now()})
         #15/6/2023-Removed due to the removing of adding tech to slot restriction, will revise later.
         # Create FSM task if product requires assembly and a corresponding FSM project exists
         # fsm_project = self.env["project.project"].search([("is_fsm", "=", True)], limit=1)
@@ -429,9 +431,11 @@ class Slot(models.Model):
         #     raise UserError(_("No FSM project found."))
         
     def set_returned_driver_portal(self):
-        self.is_returned = True
-        self.status = 'returned'
-        self.message_post(body=f"Slot returned by {self.env.user.name} at {datetime.datetime.now()}")
+        self.write({"is_returned": True, "status": 'returned'})
+        user_name = self.env.user.name
+        now = datetime.datetime.now()
+        for slot in self:
+            slot.message_post(body=f"Slot returned by {user_name} at {now}")
 
     def return_assign_technicians_view(self):
 
@@ -461,13 +465,10 @@ class Slot(models.Model):
         }
 
     def unlink(self):
-        for slot in self:
-            if slot.status != "cancelled":
-                raise UserError(
-                    "Cannot delete a slot that is not in Canclled state")
-            else:
-                super(Slot, self).unlink()
-        return True
+        if self.filtered(lambda slot: slot.status != "cancelled"):
+            raise UserError(
+                "Cannot delete a slot that is not in Canclled state")
+        return super(Slot, self).unlink()
 
     def reset_to_scheduled(self):
         for slot in self:
@@ -477,16 +478,12 @@ class Slot(models.Model):
                         f"Please reset the delivery {slot.delivery_id.name} to scheduled status before resetting the slot")
         slot.status = 'scheduled'
 
-    @api.model
-    def create(self, values):
-        if isinstance(values, dict):
-            values['name'] = self.env['ir.sequence'].next_by_code(
-                'logistic.slot.code')
-            values['guid'] = uuid.uuid4()
-        elif isinstance(values, list):
-            for value in values:
-                value['name'] = self.env['ir.sequence'].next_by_code(
-                    'logistic.slot.code')
-                value['guid'] = uuid.uuid4()
-        res = super(Slot, self).create(values)
+    @api.model_create_multi
+    def create(self, vals_list):
+        names = next_sequence_names(self.env, 'logistic.slot.code', len(vals_list))
+        guids = generate_guids(len(vals_list))
+        for vals, name, guid in zip(vals_list, names, guids):
+            vals['name'] = name
+            vals['guid'] = guid
+        res = super(Slot, self).create(vals_list)
         return res
\ No newline at end of file
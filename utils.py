@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Helpers shared by the logistic models when creating records"""
+from os import urandom
+import uuid
+from typing import List
+
+
+def generate_guids(count: int) -> List[str]:
+    """Returns `count` random (version 4) UUID strings drawn from a single urandom call"""
+    random_bytes = urandom(16 * count)
+    return [str(uuid.UUID(bytes=random_bytes[index * 16:(index + 1) * 16], version=4)) for index in range(count)]
+
+
+def next_sequence_names(env, code: str, count: int) -> List[str]:
+    """Returns the next `count` values of the sequence `code`.
+
+    Standard sequences without date ranges are backed by a postgres sequence, so all the numbers are drawn
+    in a single query; any other sequence falls back to next_by_code once per value.
+    """
+    sequence = env['ir.sequence'].sudo().search(
+        [('code', '=', code), ('company_id', 'in', [env.company.id, False])], order='company_id', limit=1)
+    if sequence and sequence.implementation == 'standard' and not sequence.use_date_range:
+        env.cr.execute("SELECT nextval(%s) FROM generate_series(1, %s)", ('ir_sequence_%03d' % sequence.id, count))
+        return [sequence.get_next_char(number) for number, in env.cr.fetchall()]
+    return [env['ir.sequence'].next_by_code(code) for index in range(count)]